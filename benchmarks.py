@@ -0,0 +1,664 @@
+"""Benchmarks for the FLUX LoRA DLC app.
+
+Usage:
+    python benchmarks.py preview --width 1536 --height 1536 --steps 28
+    python benchmarks.py preview-check
+    python benchmarks.py sequence-length
+    python benchmarks.py scheduling
+    python benchmarks.py mixed-lora-check
+    python benchmarks.py compile
+    python benchmarks.py hotswap-check
+    python benchmarks.py lora-cache-check
+    python benchmarks.py step-cache --loras 0,1,2 --seeds 0,1,2
+    python benchmarks.py img2img-check
+
+Benchmarks that import app load FLUX.1-dev, so run them on the GPU machine that serves the app.
+The others run on the CPU with a tiny random-weight FLUX pipeline or a stub.
+"""
+import os
+import time
+import argparse
+import threading
+
+import numpy as np
+import torch
+
+# importing app must not start downloading the whole LoRA catalog
+os.environ.setdefault("LORA_PREFETCH", "0")
+
+
+def build_tiny_flux_pipeline(num_layers=2, num_single_layers=4, seed=0):
+    from diffusers import AutoencoderTiny, FlowMatchEulerDiscreteScheduler, FluxPipeline, FluxTransformer2DModel
+
+    torch.manual_seed(seed)
+    transformer = FluxTransformer2DModel(
+        patch_size=1,
+        in_channels=64,
+        num_layers=num_layers,
+        num_single_layers=num_single_layers,
+        attention_head_dim=16,
+        num_attention_heads=2,
+        joint_attention_dim=32,
+        pooled_projection_dim=32,
+        guidance_embeds=True,
+        axes_dims_rope=(4, 6, 6),
+    )
+    # same latent layout as TAEF1: 16 channels, 8x spatial downsampling
+    vae = AutoencoderTiny(
+        latent_channels=16,
+        encoder_block_out_channels=(8, 8, 8, 8),
+        decoder_block_out_channels=(8, 8, 8, 8),
+        num_encoder_blocks=(1, 1, 1, 1),
+        num_decoder_blocks=(1, 1, 1, 1),
+        scaling_factor=0.3611,
+        shift_factor=0.1159,
+    )
+    scheduler = FlowMatchEulerDiscreteScheduler(use_dynamic_shifting=True, base_shift=0.5, max_shift=1.15)
+    pipeline = FluxPipeline(scheduler=scheduler, vae=vae, text_encoder=None, tokenizer=None, text_encoder_2=None, tokenizer_2=None, transformer=transformer)
+    return pipeline.to("cpu")
+
+
+def build_tiny_good_vae(seed=1):
+    from diffusers import AutoencoderKL
+
+    torch.manual_seed(seed)
+    # same latent layout as the FLUX.1 VAE: 16 channels, 8x spatial downsampling
+    return AutoencoderKL(
+        in_channels=3,
+        out_channels=3,
+        down_block_types=("DownEncoderBlock2D",) * 4,
+        up_block_types=("UpDecoderBlock2D",) * 4,
+        block_out_channels=(8, 8, 8, 8),
+        layers_per_block=1,
+        latent_channels=16,
+        norm_num_groups=4,
+        scaling_factor=0.3611,
+        shift_factor=0.1159,
+        use_quant_conv=False,
+        use_post_quant_conv=False,
+    )
+
+
+def tiny_prompt_embeds(seq_len=16, seed=0):
+    generator = torch.Generator().manual_seed(seed)
+    return torch.randn(1, seq_len, 32, generator=generator), torch.randn(1, 32, generator=generator)
+
+
+def run_tiny_generation(pipeline, preview_worker=None, width=256, height=256, steps=8, seed=0):
+    from live_preview_helpers import flux_pipe_call_that_returns_an_iterable_of_images, resolve_preview
+
+    prompt_embeds, pooled_prompt_embeds = tiny_prompt_embeds()
+    frames = flux_pipe_call_that_returns_an_iterable_of_images(
+        pipeline,
+        prompt_embeds=prompt_embeds,
+        pooled_prompt_embeds=pooled_prompt_embeds,
+        num_inference_steps=steps,
+        width=width,
+        height=height,
+        generator=torch.Generator().manual_seed(seed),
+        good_vae=pipeline.vae,
+        preview_worker=preview_worker,
+    )
+    return [np.asarray(resolve_preview(image)) for image in frames]
+
+
+def load_app():
+    import app
+    app.pipe.to(app.device)
+    return app
+
+
+def run_generation(app, **kwargs):
+    from live_preview_helpers import resolve_preview
+
+    previews = 0
+    start = time.perf_counter()
+    for image in app.pipe.flux_pipe_call_that_returns_an_iterable_of_images(good_vae=app.good_vae, output_type="pil", preview_worker=app.preview_worker, **kwargs):
+        previews += resolve_preview(image) is not None
+    # the final good_vae image is not a preview
+    return time.perf_counter() - start, previews - 1
+
+
+def bench_preview(args):
+    app = load_app()
+    print(f"{args.width}x{args.height}, {args.steps} steps, {args.runs} runs per policy")
+    for policy_name, policy in app.PREVIEW_POLICIES.items():
+        timings = []
+        for run in range(args.warmup + args.runs):
+            elapsed, previews = run_generation(
+                app,
+                prompt=args.prompt,
+                num_inference_steps=args.steps,
+                width=args.width,
+                height=args.height,
+                generator=torch.Generator(device=app.device).manual_seed(args.seed),
+                preview_every=policy["every"],
+                preview_downscale=policy["downscale"],
+            )
+            if run >= args.warmup:
+                timings.append(elapsed)
+        mean = sum(timings) / len(timings)
+        print(f"{policy_name:<16} {mean:8.2f}s total {mean / args.steps * 1000:8.1f} ms/step {previews:4d} previews")
+
+
+SEQUENCE_LENGTH_PROMPTS = [
+    "Super Realism, a portrait of an old fisherman, weathered skin, soft window light",
+    "a cozy cabin in a snowy forest at dusk, warm light in the windows, smoke from the chimney, wide shot",
+    "Ghibli Art, a girl riding a bicycle along a coastal road in summer, fluffy clouds, sparkling sea, "
+    "wildflowers by the roadside, detailed background, cel shading, vibrant colors, gentle breeze in her hair",
+]
+
+
+def psnr(a, b):
+    mse = np.mean((a.astype(np.float64) - b.astype(np.float64)) ** 2)
+    return float("inf") if mse == 0 else 10 * np.log10(255 ** 2 / mse)
+
+
+def bench_sequence_length(args):
+    app = load_app()
+    print(f"{args.width}x{args.height}, {args.steps} steps; quality is PSNR of the final image against the 512-token baseline")
+    for prompt in SEQUENCE_LENGTH_PROMPTS:
+        num_tokens = len(app.pipe.tokenizer_2(prompt, truncation=False).input_ids)
+        print(f"\n{num_tokens} T5 tokens: {prompt[:60]}...")
+        baseline = None
+        for bucket in sorted(app.SEQUENCE_LENGTH_BUCKETS, reverse=True):
+            if bucket < num_tokens:
+                continue
+            prompt_embeds, pooled_prompt_embeds, _ = app.prompt_cache.encode(app.pipe, prompt, max_sequence_length=bucket)
+            timings = []
+            for run in range(args.warmup + args.runs):
+                final_image = None
+                start = time.perf_counter()
+                for image in app.pipe.flux_pipe_call_that_returns_an_iterable_of_images(
+                    prompt_embeds=prompt_embeds,
+                    pooled_prompt_embeds=pooled_prompt_embeds,
+                    num_inference_steps=args.steps,
+                    width=args.width,
+                    height=args.height,
+                    generator=torch.Generator(device=app.device).manual_seed(args.seed),
+                    max_sequence_length=bucket,
+                    good_vae=app.good_vae,
+                    preview_every=0,
+                ):
+                    final_image = image
+                if run >= args.warmup:
+                    timings.append(time.perf_counter() - start)
+            final_image = np.asarray(final_image)
+            if baseline is None:
+                baseline = final_image
+            mean = sum(timings) / len(timings)
+            print(f"  {bucket:4d} tokens {mean / args.steps * 1000:8.1f} ms/step  PSNR vs 512: {psnr(baseline, final_image):6.2f} dB")
+
+
+class StubJob:
+    def __init__(self, adapter, steps):
+        from scheduling import FrameStream
+
+        self.adapters = (adapter,)
+        self.key = (self.adapters, steps)
+        self.steps = steps
+        self.submitted_at = time.monotonic()
+        self.stream = FrameStream(steps)
+        self.started = threading.Event()
+
+
+class StubPipeline:
+    # stands in for run_generation_batch: loading another adapter and every denoising step just sleep
+    def __init__(self, load_cost, step_cost):
+        self.load_cost = load_cost
+        self.step_cost = step_cost
+        self.active = None
+        self.loads = 0
+
+    def run_batch(self, batch):
+        if batch[0].adapters != self.active:
+            time.sleep(self.load_cost)
+            self.active = batch[0].adapters
+            self.loads += 1
+        for _ in range(batch[0].steps):
+            time.sleep(self.step_cost)
+            yield [None] * len(batch)
+
+
+def run_stub_schedule(fairness_window, adapters, args):
+    from scheduling import GenerationScheduler
+
+    pipeline = StubPipeline(args.load_cost, args.step_cost)
+    scheduler = GenerationScheduler(pipeline.run_batch, max_batch_size=1, window=0, fairness_window=fairness_window)
+    waits = []
+
+    def client(job):
+        for step, _, _ in job.stream:
+            if step == 1:
+                waits.append(time.monotonic() - job.submitted_at)
+
+    threads = []
+    start = time.monotonic()
+    for adapter in adapters:
+        job = StubJob(adapter, args.steps)
+        threads.append(threading.Thread(target=client, args=(job,)))
+        threads[-1].start()
+        scheduler.submit(job)
+        time.sleep(args.arrival)
+    for thread in threads:
+        thread.join()
+    return time.monotonic() - start, pipeline.loads, waits, scheduler.metrics()
+
+
+def bench_scheduling(args):
+    rng = np.random.default_rng(args.seed)
+    adapters = [f"lora_{i}" for i in rng.integers(0, args.loras, args.jobs)]
+    print(f"{args.jobs} jobs over {args.loras} LoRAs, load {args.load_cost}s, {args.steps} steps of {args.step_cost}s")
+    for name, fairness_window in (("FIFO", 0), (f"affinity {args.fairness_window}s", args.fairness_window)):
+        elapsed, loads, waits, metrics = run_stub_schedule(fairness_window, adapters, args)
+        print(
+            f"{name:<16} {elapsed:6.2f}s total {loads:3d} loads {metrics['swaps_avoided']:3d} swaps avoided "
+            f"{metrics['added_wait']:6.2f}s added wait, time to first step mean {np.mean(waits):.2f}s max {np.max(waits):.2f}s"
+        )
+
+
+def tiny_transformer_inputs(batch_size, height=64, width=64, seq_len=16, seed=0):
+    generator = torch.Generator().manual_seed(seed)
+    image_seq_len = (height // 16) * (width // 16)
+    return {
+        "hidden_states": torch.randn(batch_size, image_seq_len, 64, generator=generator),
+        "encoder_hidden_states": torch.randn(batch_size, seq_len, 32, generator=generator),
+        "pooled_projections": torch.randn(batch_size, 32, generator=generator),
+        "timestep": torch.rand(batch_size, generator=generator),
+        "guidance": torch.full((batch_size,), 3.5),
+        "img_ids": torch.zeros(image_seq_len, 3),
+        "txt_ids": torch.zeros(seq_len, 3),
+        "return_dict": False,
+    }
+
+
+def bench_mixed_lora_check(args):
+    from peft import LoraConfig
+    from lora_batching import GatheredLora
+
+    transformer = build_tiny_flux_pipeline().transformer
+    # different ranks and target modules, so padding and adapters that skip a layer are covered
+    adapters = {
+        "style_a": LoraConfig(r=4, lora_alpha=4, target_modules=["to_q", "to_k", "to_v", "to_out.0"], init_lora_weights=False),
+        "style_b": LoraConfig(r=8, lora_alpha=16, target_modules=["to_q", "to_v", "proj_mlp", "proj_out", "ff.net.2"], init_lora_weights=False),
+        "style_c": LoraConfig(r=2, lora_alpha=1, target_modules=["to_k", "add_k_proj", "norm.linear"], init_lora_weights=False),
+    }
+    for name, config in adapters.items():
+        transformer.add_adapter(config, adapter_name=name)
+    names = list(adapters)
+    sample_adapters = [names[i % len(names)] for i in range(args.batch_size)]
+    sample_scales = [0.5 + 0.25 * i for i in range(args.batch_size)]
+    inputs = tiny_transformer_inputs(args.batch_size)
+
+    with torch.no_grad():
+        start = time.perf_counter()
+        reference = []
+        for i, (name, scale) in enumerate(zip(sample_adapters, sample_scales)):
+            transformer.set_adapters([name], [scale])
+            sample = {k: v[i:i + 1] if k not in ("img_ids", "txt_ids", "return_dict") else v for k, v in inputs.items()}
+            reference.append(transformer(**sample)[0])
+        reference = torch.cat(reference)
+        sequential_time = time.perf_counter() - start
+
+        transformer.set_adapters(names, [1.0] * len(names))
+        transformer.disable_lora()
+        gathered = GatheredLora(transformer, names, sample_adapters, sample_scales)
+        start = time.perf_counter()
+        batched = transformer(**inputs)[0]
+        batched_time = time.perf_counter() - start
+        gathered.remove()
+        # a later batch over the same adapters reuses the banks instead of copying the adapters again
+        reused = GatheredLora(transformer, names, sample_adapters, sample_scales, banks=dict(gathered.banks))
+        reused_batched = transformer(**inputs)[0]
+        reused.remove()
+        transformer.enable_lora()
+
+    error = (batched - reference).abs().max().item()
+    print(f"{args.batch_size} samples over {len(names)} adapters, {gathered.layers} gathered layers: "
+          f"one at a time {sequential_time * 1000:.1f} ms, gathered batch {batched_time * 1000:.1f} ms")
+    if error > 1e-4:
+        raise SystemExit(f"Gathered LoRA output differs from per-sample peft output by {error:.2e}")
+    print(f"Gathered LoRA output matches per-sample peft output (max abs difference {error:.2e})")
+    reused_error = (reused_batched - reference).abs().max().item()
+    if any(reused.banks[module] is not bank for module, bank in gathered.banks.items()) or reused_error > 1e-4:
+        raise SystemExit(f"Reused banks differ from the per-sample peft output by {reused_error:.2e}")
+    print(f"Reused banks match too (max abs difference {reused_error:.2e})")
+
+
+def time_steps(denoiser, inputs, steps):
+    with torch.inference_mode():
+        start = time.perf_counter()
+        for _ in range(steps):
+            denoiser(**inputs)
+        return (time.perf_counter() - start) / steps
+
+
+def bench_compile(args):
+    from compile_buckets import CompiledTransformer, dummy_transformer_inputs, parse_buckets
+
+    transformer = build_tiny_flux_pipeline(num_layers=args.layers, num_single_layers=args.single_layers).transformer
+    buckets = parse_buckets(args.buckets)
+    compiled = CompiledTransformer(transformer, buckets, mode=args.mode)
+    start = time.perf_counter()
+    compiled.warmup(sequence_lengths=(args.sequence_length,))
+    print(f"warmup of {len(buckets)} buckets took {time.perf_counter() - start:.1f}s")
+    # one size outside the buckets shows the eager fallback
+    off_bucket = (buckets[0][0] + 16, buckets[0][1])
+    for width, height in buckets + [off_bucket]:
+        inputs = dummy_transformer_inputs(transformer, width, height, sequence_length=args.sequence_length)
+        denoiser = compiled.select(width, height)
+        eager = time_steps(transformer, inputs, args.warmup_steps)  # warm up
+        eager = time_steps(transformer, inputs, args.steps)
+        if denoiser is None:
+            print(f"{width}x{height}: {eager * 1000:8.2f} ms/step eager (outside the buckets, not compiled)")
+            continue
+        time_steps(denoiser, inputs, args.warmup_steps)
+        fast = time_steps(denoiser, inputs, args.steps)
+        with torch.inference_mode():
+            error = (denoiser(**inputs)[0] - transformer(**inputs)[0]).abs().max().item()
+        print(f"{width}x{height}: {eager * 1000:8.2f} ms/step eager {fast * 1000:8.2f} ms/step compiled "
+              f"({eager / fast:.2f}x, max abs difference {error:.1e})")
+
+
+def random_lora_state_dict(transformer, rank, targets, seed):
+    generator = torch.Generator().manual_seed(seed)
+    state_dict = {}
+    for module_name, module in transformer.named_modules():
+        base_layer = getattr(module, "base_layer", module)
+        if module_name.endswith(targets) and isinstance(base_layer, torch.nn.Linear):
+            state_dict[f"transformer.{module_name}.lora_A.weight"] = torch.randn(rank, base_layer.in_features, generator=generator) * 0.1
+            state_dict[f"transformer.{module_name}.lora_B.weight"] = torch.randn(base_layer.out_features, rank, generator=generator) * 0.1
+    return state_dict
+
+
+def bench_hotswap_check(args):
+    from lora_hotswap import hotswap_lora, prepare_hotswap_slot
+
+    pipeline = build_tiny_flux_pipeline()
+    transformer = pipeline.transformer
+    nbytes = prepare_hotswap_slot(pipeline, args.rank)
+    # different ranks and target modules; the styles are built once the slot exists, so every layer is a peft layer
+    styles = {
+        "style_a": random_lora_state_dict(transformer, 4, ("to_q", "to_k", "to_out.0"), seed=1),
+        "style_b": random_lora_state_dict(transformer, args.rank, ("proj_mlp", "ff.net.2", "norm.linear"), seed=2),
+        "style_c": random_lora_state_dict(transformer, 2, ("to_v", "add_v_proj"), seed=3),
+    }
+    inputs = tiny_transformer_inputs(1)
+    compiled = torch.compile(transformer, dynamic=False)
+    outputs, swap_times = {}, []
+    with torch.inference_mode():
+        for run, (name, state_dict) in enumerate(list(styles.items()) * 2):
+            start = time.perf_counter()
+            hotswap_lora(pipeline, dict(state_dict))
+            swap_times.append(time.perf_counter() - start)
+            # after the first compilation every swap must reuse the compiled graph
+            torch.compiler.set_stance("fail_on_recompile" if run else "default")
+            outputs[name] = compiled(**inputs)[0]
+        torch.compiler.set_stance("default")
+
+        load_times, errors = [], []
+        for name, state_dict in styles.items():
+            start = time.perf_counter()
+            pipeline.load_lora_weights(dict(state_dict), adapter_name=name)
+            pipeline.set_adapters([name])
+            load_times.append(time.perf_counter() - start)
+            errors.append((transformer(**inputs)[0] - outputs[name]).abs().max().item())
+
+    print(f"rank {args.rank} slot ({nbytes / 2**10:.0f} KB): hot-swap {np.mean(swap_times) * 1000:.1f} ms, "
+          f"load as a new adapter {np.mean(load_times) * 1000:.1f} ms; no recompilation across {len(swap_times) - 1} swaps")
+    if max(errors) > 1e-4:
+        raise SystemExit(f"Hot-swapped output differs from the regularly loaded LoRA by {max(errors):.2e}")
+    print(f"Hot-swapped output matches the regularly loaded LoRAs (max abs difference {max(errors):.2e})")
+
+
+def bench_lora_cache_check(args):
+    import tempfile
+    from PIL import Image
+    from safetensors.torch import save_file
+    from live_preview_helpers import flux_img2img_call_that_returns_an_iterable_of_images, flux_pipe_call_that_returns_an_iterable_of_images
+    from lora_residency import LoraCache, lora_adapter_name
+
+    pipeline = build_tiny_flux_pipeline()
+    good_vae = build_tiny_good_vae()
+    store = tempfile.mkdtemp()
+    loras, paths = [], {}
+    for i in range(3):
+        lora = {"title": f"LoRA {i}", "repo": f"bench/lora-{i}", "weights": "lora.safetensors"}
+        paths[lora["repo"]] = os.path.join(store, f"{i}", "lora.safetensors")
+        os.makedirs(os.path.dirname(paths[lora["repo"]]))
+        save_file(random_lora_state_dict(pipeline.transformer, 4, ("to_q", "to_k", "to_v", "proj_out"), seed=i), paths[lora["repo"]])
+        loras.append(lora)
+    cache = LoraCache(pipeline, fetch=lambda lora: paths[lora["repo"]], max_adapters=2)
+    loads = []
+    load_lora_weights = pipeline.load_lora_weights
+    pipeline.load_lora_weights = lambda *a, **kw: (loads.append(kw["adapter_name"]), load_lora_weights(*a, **kw))[1]
+
+    prompt_embeds, pooled_prompt_embeds = tiny_prompt_embeds()
+    image = Image.fromarray(np.random.default_rng(0).integers(0, 256, (128, 128, 3), dtype=np.uint8))
+
+    def generate(mode):
+        generator = torch.Generator().manual_seed(0)
+        kwargs = dict(prompt_embeds=prompt_embeds, pooled_prompt_embeds=pooled_prompt_embeds, num_inference_steps=2, width=128, height=128, generator=generator, guidance_scale=3.5, output_type="np")
+        # like the app, both modes run through the one pipeline and its adapters
+        if mode == "t2i":
+            return np.asarray(list(flux_pipe_call_that_returns_an_iterable_of_images(pipeline, **kwargs, good_vae=good_vae, preview_every=0))[-1])
+        return np.asarray(list(flux_img2img_call_that_returns_an_iterable_of_images(pipeline, image=image, strength=0.6, **kwargs, good_vae=good_vae, preview_every=0))[-1])
+
+    # with two resident slots and three LoRAs this covers mode switches on the same LoRA, switches to a resident
+    # but inactive adapter, evictions and reloads of evicted adapters
+    sequence = [0, 0, 1, 1, 0, 0, 2, 2, 1, 0, 1, 1, 2, 0, 0, 2]
+    resident, expected_hits, reference = [], 0, {}
+    for step, index in enumerate(sequence * args.repeat):
+        mode = ("t2i", "i2i")[step % 2]
+        lora = loras[index]
+        name = lora_adapter_name(lora)
+        loads_before = len(loads)
+        was_resident = name in resident
+        cache.activate(lora)
+        if was_resident:
+            expected_hits += 1
+            resident.remove(name)
+        resident.append(name)
+        del resident[:-2]
+        active = set(pipeline.get_active_adapters())
+        if active != {name}:
+            raise SystemExit(f"Step {step} ({mode}): expected {name} active, got {active}")
+        if cache.hits != expected_hits or len(loads) != step + 1 - expected_hits:
+            raise SystemExit(f"Step {step} ({mode}): hits={cache.hits} loads={len(loads)}, expected hits={expected_hits} loads={step + 1 - expected_hits}")
+        # a mode switch with the same LoRA (or any switch to a resident one) must not load anything
+        if was_resident and len(loads) != loads_before:
+            raise SystemExit(f"Step {step} ({mode}): resident adapter {name} was loaded again")
+        output = generate(mode)
+        # the same LoRA in the same mode must give the same image no matter what ran in between
+        if (name, mode) in reference and not np.array_equal(reference[(name, mode)], output):
+            raise SystemExit(f"Step {step} ({mode}): {name} no longer reproduces its image")
+        reference.setdefault((name, mode), output)
+    for mode in ("t2i", "i2i"):
+        outputs = [output for (_, output_mode), output in reference.items() if output_mode == mode]
+        if any(np.array_equal(a, b) for i, a in enumerate(outputs) for b in outputs[i + 1:]):
+            raise SystemExit(f"Two LoRAs gave the same {mode} image, so the check cannot tell adapters apart")
+    print(f"{step + 1} alternating t2i/i2i requests over {len(loras)} LoRAs: {cache.hits} hits, {len(loads)} loads, "
+          f"{cache.evictions} evictions, {len(reference)} images reproduced")
+    print("Active adapters, hit counts and loads are correct across mode switches")
+
+
+def bench_step_cache(args):
+    from live_preview_helpers import StepCache
+
+    app = load_app()
+    thresholds = [float(threshold) for threshold in args.thresholds.split(",")]
+    seeds = [int(seed) for seed in args.seeds.split(",")]
+    print(f"{args.width}x{args.height}, {args.steps} steps, seeds {seeds}; quality is PSNR of the final image against threshold 0")
+    results = {threshold: {"time": [], "psnr": [], "skipped": []} for threshold in thresholds}
+    for lora_id in args.loras.split(","):
+        lora = app.catalog[int(lora_id)]
+        app.lora_cache.activate(lora, scale=args.lora_scale)
+        prompt = app.build_prompt_mash(args.prompt, [lora])
+        prompt_embeds, pooled_prompt_embeds, _ = app.prompt_cache.encode(app.pipe, prompt, lora_scale=args.lora_scale)
+        for seed in seeds:
+            baseline = None
+            for threshold in [0.0] + [threshold for threshold in thresholds if threshold > 0]:
+                step_cache = StepCache(threshold) if threshold > 0 else None
+                start = time.perf_counter()
+                for image in app.pipe.flux_pipe_call_that_returns_an_iterable_of_images(
+                    prompt_embeds=prompt_embeds,
+                    pooled_prompt_embeds=pooled_prompt_embeds,
+                    num_inference_steps=args.steps,
+                    width=args.width,
+                    height=args.height,
+                    generator=torch.Generator(device=app.device).manual_seed(seed),
+                    joint_attention_kwargs={"scale": args.lora_scale},
+                    good_vae=app.good_vae,
+                    preview_every=0,
+                    step_cache=step_cache,
+                ):
+                    final_image = image
+                elapsed = time.perf_counter() - start
+                final_image = np.asarray(final_image)
+                if baseline is None:
+                    baseline = final_image
+                if threshold in results:
+                    results[threshold]["time"].append(elapsed)
+                    results[threshold]["psnr"].append(psnr(baseline, final_image))
+                    results[threshold]["skipped"].append(step_cache.skipped_steps / step_cache.steps if step_cache else 0.0)
+                print(f"  {lora['title'][:28]:<28} seed {seed:<4} threshold {threshold:<5} {elapsed:6.2f}s")
+    baseline_time = np.mean(results[0.0]["time"]) if 0.0 in results else None
+    print("\nthreshold   mean time   speedup   skipped steps   PSNR vs 0 (min)")
+    for threshold, result in results.items():
+        speedup = f"{baseline_time / np.mean(result['time']):6.2f}x" if baseline_time else "      -"
+        print(f"{threshold:9} {np.mean(result['time']):9.2f}s   {speedup}   {np.mean(result['skipped']) * 100:12.0f}%   "
+              f"{np.mean(result['psnr']):6.2f} dB ({np.min(result['psnr']):.2f})")
+
+
+def bench_preview_check(args):
+    from live_preview_helpers import PreviewWorker
+
+    pipeline = build_tiny_flux_pipeline()
+    run_tiny_generation(pipeline, steps=args.steps)  # warm up
+    start = time.perf_counter()
+    inline = run_tiny_generation(pipeline, steps=args.steps)
+    inline_time = time.perf_counter() - start
+    start = time.perf_counter()
+    worker = run_tiny_generation(pipeline, preview_worker=PreviewWorker("cpu"), steps=args.steps)
+    worker_time = time.perf_counter() - start
+    mismatches = [i for i, (a, b) in enumerate(zip(inline, worker)) if not np.array_equal(a, b)]
+    print(f"inline {inline_time:.3f}s, preview worker {worker_time:.3f}s, {len(worker)} frames")
+    if len(inline) != len(worker) or mismatches:
+        raise SystemExit(f"Preview worker changed the output: {len(inline)} vs {len(worker)} frames, mismatching frames {mismatches}")
+    print("Preview sequence and final image are identical")
+
+
+def bench_img2img_check(args):
+    from diffusers import FluxImg2ImgPipeline
+    from PIL import Image
+    from live_preview_helpers import flux_img2img_call_that_returns_an_iterable_of_images
+
+    pipeline = build_tiny_flux_pipeline()
+    good_vae = build_tiny_good_vae()
+    stock = FluxImg2ImgPipeline(scheduler=pipeline.scheduler, vae=good_vae, text_encoder=None, tokenizer=None, text_encoder_2=None, tokenizer_2=None, transformer=pipeline.transformer)
+    image = Image.fromarray(np.random.default_rng(0).integers(0, 256, (args.height, args.width, 3), dtype=np.uint8))
+    prompt_embeds, pooled_prompt_embeds = tiny_prompt_embeds()
+    kwargs = dict(
+        image=image,
+        strength=args.strength,
+        guidance_scale=3.5,
+        prompt_embeds=prompt_embeds,
+        pooled_prompt_embeds=pooled_prompt_embeds,
+        num_inference_steps=args.steps,
+        width=args.width,
+        height=args.height,
+    )
+    expected = np.asarray(stock(**kwargs, generator=torch.Generator().manual_seed(0)).images[0], dtype=np.float64)
+    frames = list(flux_img2img_call_that_returns_an_iterable_of_images(pipeline, **kwargs, generator=torch.Generator().manual_seed(0), good_vae=good_vae))
+    result = np.asarray(frames[-1], dtype=np.float64)
+    difference = np.abs(result - expected).max()
+    print(f"{len(frames) - 1} preview frames for {args.steps} steps at strength {args.strength}, final image max difference {difference:.0f}/255")
+    if difference > 1:
+        raise SystemExit("Streaming image-to-image does not match the stock pipeline")
+    print("Final image matches the stock image-to-image pipeline")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    subparsers = parser.add_subparsers(dest="benchmark", required=True)
+
+    preview = subparsers.add_parser("preview", help="Generation throughput for each live preview policy")
+    preview.add_argument("--prompt", default="a photo of a red fox in the snow")
+    preview.add_argument("--width", type=int, default=1024)
+    preview.add_argument("--height", type=int, default=1024)
+    preview.add_argument("--steps", type=int, default=28)
+    preview.add_argument("--seed", type=int, default=0)
+    preview.add_argument("--runs", type=int, default=3)
+    preview.add_argument("--warmup", type=int, default=1)
+    preview.set_defaults(func=bench_preview)
+
+    preview_check = subparsers.add_parser("preview-check", help="Check on the CPU that the preview worker does not change any frame")
+    preview_check.add_argument("--steps", type=int, default=8)
+    preview_check.set_defaults(func=bench_preview_check)
+
+    sequence_length = subparsers.add_parser("sequence-length", help="Step latency and quality for each T5 sequence length bucket")
+    sequence_length.add_argument("--width", type=int, default=1024)
+    sequence_length.add_argument("--height", type=int, default=1024)
+    sequence_length.add_argument("--steps", type=int, default=28)
+    sequence_length.add_argument("--seed", type=int, default=0)
+    sequence_length.add_argument("--runs", type=int, default=2)
+    sequence_length.add_argument("--warmup", type=int, default=1)
+    sequence_length.set_defaults(func=bench_sequence_length)
+
+    scheduling = subparsers.add_parser("scheduling", help="Adapter swaps and waiting times of FIFO vs LoRA-affine scheduling, with a CPU stub pipeline")
+    scheduling.add_argument("--jobs", type=int, default=24)
+    scheduling.add_argument("--loras", type=int, default=4)
+    scheduling.add_argument("--steps", type=int, default=4)
+    scheduling.add_argument("--step-cost", type=float, default=0.01)
+    scheduling.add_argument("--load-cost", type=float, default=0.1)
+    scheduling.add_argument("--arrival", type=float, default=0.005, help="Seconds between job arrivals")
+    scheduling.add_argument("--fairness-window", type=float, default=1.0)
+    scheduling.add_argument("--seed", type=int, default=0)
+    scheduling.set_defaults(func=bench_scheduling)
+
+    mixed_lora_check = subparsers.add_parser("mixed-lora-check", help="Check on the CPU that gathered per-sample LoRA matches running each sample with its adapter")
+    mixed_lora_check.add_argument("--batch-size", type=int, default=6)
+    mixed_lora_check.set_defaults(func=bench_mixed_lora_check)
+
+    compile_parser = subparsers.add_parser("compile", help="Steady-state step latency of the eager vs compiled tiny transformer on the CPU, per resolution bucket")
+    compile_parser.add_argument("--buckets", default="256x256,512x512")
+    compile_parser.add_argument("--mode", default="default")
+    compile_parser.add_argument("--layers", type=int, default=2)
+    compile_parser.add_argument("--single-layers", type=int, default=4)
+    compile_parser.add_argument("--sequence-length", type=int, default=64)
+    compile_parser.add_argument("--steps", type=int, default=20)
+    compile_parser.add_argument("--warmup-steps", type=int, default=3)
+    compile_parser.set_defaults(func=bench_compile)
+
+    hotswap_check = subparsers.add_parser("hotswap-check", help="Check on the CPU that hot-swapped LoRAs match regular loads without recompiling")
+    hotswap_check.add_argument("--rank", type=int, default=8)
+    hotswap_check.set_defaults(func=bench_hotswap_check)
+
+    lora_cache_check = subparsers.add_parser("lora-cache-check", help="Check on the CPU that alternating t2i/i2i requests share LoRA state without reloading adapters")
+    lora_cache_check.add_argument("--repeat", type=int, default=2, help="How many times to run the request sequence")
+    lora_cache_check.set_defaults(func=bench_lora_cache_check)
+
+    step_cache = subparsers.add_parser("step-cache", help="Speedup and image delta of the first-block step cache on catalog LoRAs with fixed seeds")
+    step_cache.add_argument("--prompt", default="a photo of a red fox in the snow")
+    step_cache.add_argument("--loras", default="0,1,2", help="Catalog ids")
+    step_cache.add_argument("--seeds", default="0,1,2")
+    step_cache.add_argument("--thresholds", default="0,0.05,0.1,0.15,0.2")
+    step_cache.add_argument("--lora-scale", type=float, default=0.95)
+    step_cache.add_argument("--width", type=int, default=1024)
+    step_cache.add_argument("--height", type=int, default=1024)
+    step_cache.add_argument("--steps", type=int, default=28)
+    step_cache.set_defaults(func=bench_step_cache)
+
+    img2img_check = subparsers.add_parser("img2img-check", help="Check on the CPU that streaming image-to-image matches the stock pipeline")
+    img2img_check.add_argument("--strength", type=float, default=0.6)
+    img2img_check.add_argument("--steps", type=int, default=10)
+    img2img_check.add_argument("--width", type=int, default=256)
+    img2img_check.add_argument("--height", type=int, default=256)
+    img2img_check.set_defaults(func=bench_img2img_check)
+
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+import time
+from functools import partial
+
+import torch
+
+def parse_buckets(spec):
+    # "1024x1024,768x1024" -> [(1024, 1024), (768, 1024)], as (width, height)
+    buckets = []
+    for bucket in spec.split(","):
+        width, height = bucket.strip().lower().split("x")
+        buckets.append((int(width), int(height)))
+    return buckets
+
+def dummy_transformer_inputs(transformer, width, height, batch_size=1, sequence_length=512):
+    # random inputs with exactly the shapes a FluxPipeline call at this resolution feeds the transformer
+    config = transformer.config
+    parameter = next(transformer.parameters())
+    device, dtype = parameter.device, parameter.dtype
+    image_seq_len = (height // 16) * (width // 16)
+    return {
+        "hidden_states": torch.randn(batch_size, image_seq_len, config.in_channels, device=device, dtype=dtype),
+        "timestep": torch.full((batch_size,), 0.5, device=device, dtype=dtype),
+        "guidance": torch.full((batch_size,), 3.5, device=device, dtype=torch.float32) if config.guidance_embeds else None,
+        "pooled_projections": torch.randn(batch_size, config.pooled_projection_dim, device=device, dtype=dtype),
+        "encoder_hidden_states": torch.randn(batch_size, sequence_length, config.joint_attention_dim, device=device, dtype=dtype),
+        "txt_ids": torch.zeros(sequence_length, 3, device=device, dtype=dtype),
+        "img_ids": torch.zeros(image_seq_len, 3, device=device, dtype=dtype),
+        "return_dict": False,
+    }
+
+class CompiledTransformer:
+    # torch.compile specializes on input shapes, and the size sliders allow hundreds of latent shapes. Requests
+    # close to one of a few resolution buckets are snapped onto it and run through one compiled module (one
+    # static graph per bucket, warmed up at startup); every other size, and any bucket whose compiled run
+    # fails, runs the eager transformer.
+    def __init__(self, transformer, buckets, mode="default", snap_tolerance=64):
+        self.transformer = transformer
+        self.buckets = list(buckets)
+        self.snap_tolerance = snap_tolerance
+        self.compiled = torch.compile(transformer, mode=mode, dynamic=False)
+        self.failed = set()
+        self.calls = {"compiled": 0, "eager": 0}
+        self.warmup_seconds = {}
+
+    def snap(self, width, height):
+        # nearest bucket if it is within snap_tolerance pixels on both sides, otherwise the size is kept
+        bucket = min(self.buckets, key=lambda b: abs(b[0] - width) + abs(b[1] - height))
+        if abs(bucket[0] - width) <= self.snap_tolerance and abs(bucket[1] - height) <= self.snap_tolerance:
+            return bucket
+        return width, height
+
+    def select(self, width, height):
+        # the callable to use as the denoiser at this size; None means the pipeline's own eager transformer
+        bucket = (width, height)
+        if bucket not in self.buckets or bucket in self.failed:
+            self.calls["eager"] += 1
+            return None
+        self.calls["compiled"] += 1
+        return partial(self._call, bucket)
+
+    def _call(self, bucket, *args, **kwargs):
+        if bucket in self.failed:
+            return self.transformer(*args, **kwargs)
+        try:
+            return self.compiled(*args, **kwargs)
+        except Exception as e:
+            print(f"Compiled transformer failed at {bucket[0]}x{bucket[1]}, running it eagerly from now on: {e}")
+            self.failed.add(bucket)
+            return self.transformer(*args, **kwargs)
+
+    @torch.inference_mode()
+    def warmup(self, batch_sizes=(1,), sequence_lengths=(512,)):
+        for width, height in self.buckets:
+            start = time.perf_counter()
+            for batch_size in batch_sizes:
+                for sequence_length in sequence_lengths:
+                    self._call((width, height), **dummy_transformer_inputs(self.transformer, width, height, batch_size, sequence_length))
+            self.warmup_seconds[(width, height)] = time.perf_counter() - start
+            print(f"Compiled transformer warmed up for {width}x{height} in {self.warmup_seconds[(width, height)]:.1f}s")
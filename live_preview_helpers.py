@@ -0,0 +1,409 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager, nullcontext
+from functools import partial
+from typing import Any, Dict, List, Optional, Union
+
+import numpy as np
+import torch
+from diffusers.utils.torch_utils import randn_tensor
+
+def calculate_shift(
+    image_seq_len,
+    base_seq_len: int = 256,
+    max_seq_len: int = 4096,
+    base_shift: float = 0.5,
+    max_shift: float = 1.16,
+):
+    m = (max_shift - base_shift) / (max_seq_len - base_seq_len)
+    b = base_shift - m * base_seq_len
+    mu = image_seq_len * m + b
+    return mu
+
+def retrieve_timesteps(
+    scheduler,
+    num_inference_steps: Optional[int] = None,
+    device: Optional[Union[str, torch.device]] = None,
+    timesteps: Optional[List[int]] = None,
+    sigmas: Optional[List[float]] = None,
+    **kwargs,
+):
+    if timesteps is not None and sigmas is not None:
+        raise ValueError("Only one of `timesteps` or `sigmas` can be passed. Please choose one to set custom values")
+    if timesteps is not None:
+        scheduler.set_timesteps(timesteps=timesteps, device=device, **kwargs)
+        timesteps = scheduler.timesteps
+        num_inference_steps = len(timesteps)
+    elif sigmas is not None:
+        scheduler.set_timesteps(sigmas=sigmas, device=device, **kwargs)
+        timesteps = scheduler.timesteps
+        num_inference_steps = len(timesteps)
+    else:
+        scheduler.set_timesteps(num_inference_steps, device=device, **kwargs)
+        timesteps = scheduler.timesteps
+    return timesteps, num_inference_steps
+
+def decode_preview(pipeline, latents, height, width, downscale, output_type, batched=False):
+    latents_for_image = pipeline._unpack_latents(latents, height, width, pipeline.vae_scale_factor)
+    if downscale > 1:
+        # TAEF1 is fully convolutional, so pooled latents decode straight to a smaller preview
+        latents_for_image = torch.nn.functional.avg_pool2d(latents_for_image, downscale, ceil_mode=True)
+    latents_for_image = (latents_for_image / pipeline.vae.config.scaling_factor) + pipeline.vae.config.shift_factor
+    image = pipeline.vae.decode(latents_for_image, return_dict=False)[0]
+    images = pipeline.image_processor.postprocess(image, output_type=output_type)
+    return images if batched else images[0]
+
+class PreviewWorker:
+    # Decodes previews off the denoising loop: the loop snapshots the latents and moves on to the next transformer
+    # call while a single worker thread (on its own CUDA stream when on GPU) runs the TAEF1 decode and PIL conversion.
+    def __init__(self, device):
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="preview")
+        self.device = torch.device(device)
+        # created on the first submit, which runs inside the GPU call: ZeroGPU forbids touching CUDA at import
+        self.stream = None
+
+    def submit(self, pipeline, latents, height, width, downscale, output_type, batched=False) -> Future:
+        snapshot = latents.clone()
+        ready = None
+        if self.stream is None and self.device.type == "cuda":
+            self.stream = torch.cuda.Stream(device=self.device)
+        if self.stream is not None:
+            ready = torch.cuda.Event()
+            ready.record()
+            snapshot.record_stream(self.stream)
+
+        def decode():
+            # inference mode is thread local
+            with torch.inference_mode():
+                if self.stream is None:
+                    return decode_preview(pipeline, snapshot, height, width, downscale, output_type, batched)
+                self.stream.wait_event(ready)
+                with torch.cuda.stream(self.stream):
+                    return decode_preview(pipeline, snapshot, height, width, downscale, output_type, batched)
+
+        return self.executor.submit(decode)
+
+class StepCache:
+    # First-block residual cache. Every step runs the first transformer block and compares the change it made
+    # to its input with the same change at the last fully computed step. While the relative difference stays
+    # below threshold, the remaining blocks are skipped and the change they made at that step is reused.
+    # Attached by patching the blocks' forward for the duration of one pipeline call, so module names (and
+    # with them LoRA keys) are untouched.
+    def __init__(self, threshold):
+        self.threshold = threshold
+        self.first_residual = None  # first block change at the last full step
+        self.residuals = None  # (encoder, image) change made by the remaining blocks at the last full step
+        self.first_output = None
+        self.skip = False
+        self.steps = 0
+        self.skipped_steps = 0
+        self.skipped_blocks = 0
+
+    @contextmanager
+    def attach(self, transformer):
+        blocks = [*transformer.transformer_blocks, *transformer.single_transformer_blocks]
+        patched = [block for block in blocks if "forward" not in block.__dict__]
+        if len(patched) != len(blocks):
+            raise RuntimeError("Transformer blocks are already patched")
+        blocks[0].forward = partial(self._first, blocks[0].forward)
+        for i, block in enumerate(blocks[1:], 1):
+            block.forward = partial(self._rest, block.forward, i == len(blocks) - 1)
+        try:
+            yield self
+        finally:
+            for block in blocks:
+                del block.forward
+
+    def _first(self, forward, **kwargs):
+        encoder_hidden_states, hidden_states = forward(**kwargs)
+        residual = hidden_states - kwargs["hidden_states"]
+        self.steps += 1
+        self.skip = False
+        if self.first_residual is not None and self.first_residual.shape == residual.shape:
+            change = (residual - self.first_residual).abs().mean() / self.first_residual.abs().mean()
+            self.skip = change.item() < self.threshold
+        if self.skip:
+            self.skipped_steps += 1
+        else:
+            self.first_residual = residual
+            self.first_output = (encoder_hidden_states, hidden_states)
+        return encoder_hidden_states, hidden_states
+
+    def _rest(self, forward, last, **kwargs):
+        if self.skip:
+            self.skipped_blocks += 1
+            if not last:
+                return kwargs["encoder_hidden_states"], kwargs["hidden_states"]
+            encoder_residual, residual = self.residuals
+            return kwargs["encoder_hidden_states"] + encoder_residual, kwargs["hidden_states"] + residual
+        encoder_hidden_states, hidden_states = forward(**kwargs)
+        if last:
+            self.residuals = (encoder_hidden_states - self.first_output[0], hidden_states - self.first_output[1])
+        return encoder_hidden_states, hidden_states
+
+def resolve_preview(image):
+    # previews from a PreviewWorker arrive as futures and are only waited on when actually displayed
+    return image.result() if isinstance(image, Future) else image
+
+# FLUX pipeline
+@torch.inference_mode()
+def flux_pipe_call_that_returns_an_iterable_of_images(
+    self,
+    prompt: Union[str, List[str]] = None,
+    prompt_2: Optional[Union[str, List[str]]] = None,
+    height: Optional[int] = None,
+    width: Optional[int] = None,
+    num_inference_steps: int = 28,
+    timesteps: List[int] = None,
+    guidance_scale: float = 3.5,
+    num_images_per_prompt: Optional[int] = 1,
+    generator: Optional[Union[torch.Generator, List[torch.Generator]]] = None,
+    latents: Optional[torch.FloatTensor] = None,
+    prompt_embeds: Optional[torch.FloatTensor] = None,
+    pooled_prompt_embeds: Optional[torch.FloatTensor] = None,
+    output_type: Optional[str] = "pil",
+    return_dict: bool = True,
+    joint_attention_kwargs: Optional[Dict[str, Any]] = None,
+    max_sequence_length: int = 512,
+    good_vae: Optional[Any] = None,
+    preview_every: int = 1,
+    preview_downscale: int = 1,
+    preview_worker: Optional[PreviewWorker] = None,
+    batched: bool = False,
+    transformer: Optional[Any] = None,
+    step_cache: Optional[StepCache] = None,
+):
+    height = height or self.default_sample_size * self.vae_scale_factor
+    width = width or self.default_sample_size * self.vae_scale_factor
+    
+    self.check_inputs(
+        prompt,
+        prompt_2,
+        height,
+        width,
+        prompt_embeds=prompt_embeds,
+        pooled_prompt_embeds=pooled_prompt_embeds,
+        max_sequence_length=max_sequence_length,
+    )
+
+    self._guidance_scale = guidance_scale
+    self._joint_attention_kwargs = joint_attention_kwargs
+    self._interrupt = False
+
+    if prompt is not None:
+        batch_size = 1 if isinstance(prompt, str) else len(prompt)
+    else:
+        batch_size = prompt_embeds.shape[0]
+    device = self._execution_device
+
+    lora_scale = joint_attention_kwargs.get("scale", None) if joint_attention_kwargs is not None else None
+    prompt_embeds, pooled_prompt_embeds, text_ids = self.encode_prompt(
+        prompt=prompt,
+        prompt_2=prompt_2,
+        prompt_embeds=prompt_embeds,
+        pooled_prompt_embeds=pooled_prompt_embeds,
+        device=device,
+        num_images_per_prompt=num_images_per_prompt,
+        max_sequence_length=max_sequence_length,
+        lora_scale=lora_scale,
+    )
+    
+    num_channels_latents = self.transformer.config.in_channels // 4
+    latents, latent_image_ids = self.prepare_latents(
+        batch_size * num_images_per_prompt,
+        num_channels_latents,
+        height,
+        width,
+        prompt_embeds.dtype,
+        device,
+        generator,
+        latents,
+    )
+    
+    sigmas = np.linspace(1.0, 1 / num_inference_steps, num_inference_steps)
+    image_seq_len = latents.shape[1]
+    mu = calculate_shift(
+        image_seq_len,
+        self.scheduler.config.base_image_seq_len,
+        self.scheduler.config.max_image_seq_len,
+        self.scheduler.config.base_shift,
+        self.scheduler.config.max_shift,
+    )
+    timesteps, num_inference_steps = retrieve_timesteps(
+        self.scheduler,
+        num_inference_steps,
+        device,
+        timesteps,
+        sigmas,
+        mu=mu,
+    )
+    self._num_timesteps = len(timesteps)
+
+    guidance = torch.full([1], guidance_scale, device=device, dtype=torch.float32).expand(latents.shape[0]) if self.transformer.config.guidance_embeds else None
+
+    yield from denoise_and_stream_images(
+        self, latents, latent_image_ids, timesteps, guidance, prompt_embeds, pooled_prompt_embeds, text_ids,
+        height, width, output_type, good_vae, preview_every, preview_downscale, preview_worker, batched, transformer, step_cache,
+    )
+
+# FLUX image-to-image pipeline, bound to the text-to-image pipeline so previews use its TAEF1 vae; good_vae encodes
+# the init image and decodes the final one
+@torch.inference_mode()
+def flux_img2img_call_that_returns_an_iterable_of_images(
+    self,
+    image: Any = None,
+    strength: float = 0.6,
+    image_latent_dist: Optional[Any] = None,
+    prompt: Union[str, List[str]] = None,
+    prompt_2: Optional[Union[str, List[str]]] = None,
+    height: Optional[int] = None,
+    width: Optional[int] = None,
+    num_inference_steps: int = 28,
+    guidance_scale: float = 3.5,
+    num_images_per_prompt: Optional[int] = 1,
+    generator: Optional[Union[torch.Generator, List[torch.Generator]]] = None,
+    prompt_embeds: Optional[torch.FloatTensor] = None,
+    pooled_prompt_embeds: Optional[torch.FloatTensor] = None,
+    output_type: Optional[str] = "pil",
+    joint_attention_kwargs: Optional[Dict[str, Any]] = None,
+    max_sequence_length: int = 512,
+    good_vae: Optional[Any] = None,
+    preview_every: int = 1,
+    preview_downscale: int = 1,
+    preview_worker: Optional[PreviewWorker] = None,
+    batched: bool = False,
+    transformer: Optional[Any] = None,
+    step_cache: Optional[StepCache] = None,
+):
+    height = height or self.default_sample_size * self.vae_scale_factor
+    width = width or self.default_sample_size * self.vae_scale_factor
+
+    self.check_inputs(
+        prompt,
+        prompt_2,
+        height,
+        width,
+        prompt_embeds=prompt_embeds,
+        pooled_prompt_embeds=pooled_prompt_embeds,
+        max_sequence_length=max_sequence_length,
+    )
+
+    self._guidance_scale = guidance_scale
+    self._joint_attention_kwargs = joint_attention_kwargs
+    self._interrupt = False
+
+    if prompt is not None:
+        batch_size = 1 if isinstance(prompt, str) else len(prompt)
+    else:
+        batch_size = prompt_embeds.shape[0]
+    batch_size = batch_size * num_images_per_prompt
+    device = self._execution_device
+
+    lora_scale = joint_attention_kwargs.get("scale", None) if joint_attention_kwargs is not None else None
+    prompt_embeds, pooled_prompt_embeds, text_ids = self.encode_prompt(
+        prompt=prompt,
+        prompt_2=prompt_2,
+        prompt_embeds=prompt_embeds,
+        pooled_prompt_embeds=pooled_prompt_embeds,
+        device=device,
+        num_images_per_prompt=num_images_per_prompt,
+        max_sequence_length=max_sequence_length,
+        lora_scale=lora_scale,
+    )
+
+    sigmas = np.linspace(1.0, 1 / num_inference_steps, num_inference_steps)
+    image_seq_len = (int(height) // self.vae_scale_factor // 2) * (int(width) // self.vae_scale_factor // 2)
+    mu = calculate_shift(
+        image_seq_len,
+        self.scheduler.config.base_image_seq_len,
+        self.scheduler.config.max_image_seq_len,
+        self.scheduler.config.base_shift,
+        self.scheduler.config.max_shift,
+    )
+    timesteps, num_inference_steps = retrieve_timesteps(
+        self.scheduler,
+        num_inference_steps,
+        device,
+        None,
+        sigmas,
+        mu=mu,
+    )
+    # strength keeps only the last part of the schedule; denoising starts from the init image noised to its first timestep
+    t_start = int(max(num_inference_steps - min(num_inference_steps * strength, num_inference_steps), 0))
+    timesteps = timesteps[t_start * self.scheduler.order:]
+    if len(timesteps) < 1:
+        raise ValueError(f"strength={strength} leaves no denoising steps out of num_inference_steps={num_inference_steps}")
+    self.scheduler.set_begin_index(t_start * self.scheduler.order)
+    self._num_timesteps = len(timesteps)
+
+    # callers may pass the good_vae latent distribution of the already preprocessed init image instead of the image
+    if image_latent_dist is None:
+        init_image = self.image_processor.preprocess(image, height=height, width=width).to(device=device, dtype=good_vae.dtype)
+        image_latent_dist = good_vae.encode(init_image).latent_dist
+    # sampling with the request's generator keeps every seed reproducible whether or not the encode was cached
+    image_latents = image_latent_dist.sample(generator)
+    image_latents = (image_latents - good_vae.config.shift_factor) * good_vae.config.scaling_factor
+    if batch_size % image_latents.shape[0] != 0:
+        raise ValueError(f"Cannot duplicate `image` of batch size {image_latents.shape[0]} to {batch_size} text prompts.")
+    image_latents = image_latents.repeat(batch_size // image_latents.shape[0], 1, 1, 1).to(prompt_embeds.dtype)
+
+    num_channels_latents = self.transformer.config.in_channels // 4
+    latent_height, latent_width = image_latents.shape[-2:]
+    latent_image_ids = self._prepare_latent_image_ids(batch_size, latent_height // 2, latent_width // 2, device, prompt_embeds.dtype)
+    noise = randn_tensor(image_latents.shape, generator=generator, device=device, dtype=prompt_embeds.dtype)
+    latents = self.scheduler.scale_noise(image_latents, timesteps[:1].repeat(batch_size), noise)
+    latents = self._pack_latents(latents, batch_size, num_channels_latents, latent_height, latent_width)
+
+    guidance = torch.full([1], guidance_scale, device=device, dtype=torch.float32).expand(latents.shape[0]) if self.transformer.config.guidance_embeds else None
+
+    yield from denoise_and_stream_images(
+        self, latents, latent_image_ids, timesteps, guidance, prompt_embeds, pooled_prompt_embeds, text_ids,
+        height, width, output_type, good_vae, preview_every, preview_downscale, preview_worker, batched, transformer, step_cache,
+    )
+
+def denoise_and_stream_images(
+    self, latents, latent_image_ids, timesteps, guidance, prompt_embeds, pooled_prompt_embeds, text_ids,
+    height, width, output_type, good_vae, preview_every, preview_downscale, preview_worker, batched, transformer, step_cache,
+):
+    # the denoising loop shared by the text-to-image and image-to-image calls: yields a TAEF1 preview (or None) per
+    # step, then the good_vae decode of the final latents
+
+    # callers may pass a compiled wrapper of self.transformer for the denoising steps
+    transformer = transformer or self.transformer
+    # the step cache patches the transformer blocks only while this loop runs
+    step_cache_context = step_cache.attach(self.transformer) if step_cache is not None else nullcontext()
+
+    with step_cache_context:
+        for i, t in enumerate(timesteps):
+            timestep = t.expand(latents.shape[0]).to(latents.dtype)
+
+            noise_pred = transformer(
+                hidden_states=latents,
+                timestep=timestep / 1000,
+                guidance=guidance,
+                pooled_projections=pooled_prompt_embeds,
+                encoder_hidden_states=prompt_embeds,
+                txt_ids=text_ids,
+                img_ids=latent_image_ids,
+                joint_attention_kwargs=self.joint_attention_kwargs,
+                return_dict=False,
+            )[0]
+
+            # steps without a preview yield None so callers can still count progress
+            if preview_every and (i % preview_every == 0 or i == len(timesteps) - 1):
+                if preview_worker is not None:
+                    yield preview_worker.submit(self, latents, height, width, preview_downscale, output_type, batched)
+                else:
+                    yield decode_preview(self, latents, height, width, preview_downscale, output_type, batched)
+            else:
+                yield None
+            latents = self.scheduler.step(noise_pred, t, latents, return_dict=False)[0]
+            torch.cuda.empty_cache()
+        
+    latents = self._unpack_latents(latents, height, width, self.vae_scale_factor)
+    latents = (latents / good_vae.config.scaling_factor) + good_vae.config.shift_factor
+    image = good_vae.decode(latents, return_dict=False)[0]
+    self.maybe_free_model_hooks()
+    torch.cuda.empty_cache()
+    images = self.image_processor.postprocess(image, output_type=output_type)
+    # batched callers get one image per sample at every step
+    yield images if batched else images[0]
@@ -0,0 +1,59 @@
+from functools import partial
+
+import torch
+from peft.tuners.tuners_utils import BaseTunerLayer
+
+class GatheredLora:
+    # Per-sample LoRA for batches whose samples use different adapters. The peft layers run with adapters
+    # disabled, so the base weights are read once for the whole batch; a forward hook then adds each sample's
+    # own low-rank update with two gathered bmms over a bank of the layer's A/B matrices, zero-padded to the
+    # largest rank in the batch. Padding rows and adapters that skip a layer contribute exactly zero.
+    # banks (module -> (lora_A, lora_B)) from an earlier GatheredLora over the same names are reused as is.
+    def __init__(self, transformer, names, sample_adapters, sample_scales, banks=None):
+        self.transformer = transformer
+        self.names = list(names)
+        self.banks = {} if banks is None else banks
+        self.handles = []
+        self.layers = 0
+        self.bank_bytes = 0
+        for module in transformer.modules():
+            if isinstance(module, BaseTunerLayer) and any(name in getattr(module, "lora_A", {}) for name in self.names):
+                bank = self.banks.get(module)
+                if bank is None:
+                    bank = self.banks[module] = self._bank(module)
+                self.handles.append(module.register_forward_hook(partial(self._hook, bank)))
+                self.layers += 1
+                self.bank_bytes += sum(t.numel() * t.element_size() for t in bank)
+        device = next(transformer.parameters()).device
+        self.index = torch.tensor([self.names.index(name) for name in sample_adapters], device=device)
+        self.scales = torch.tensor(sample_scales, device=device, dtype=torch.float32)
+
+    def _bank(self, module):
+        present = [name for name in self.names if name in module.lora_A]
+        reference = module.lora_A[present[0]].weight
+        rank = max(module.r[name] for name in present)
+        lora_A = reference.new_zeros(len(self.names), rank, module.in_features)
+        lora_B = reference.new_zeros(len(self.names), module.out_features, rank)
+        with torch.no_grad():
+            for i, name in enumerate(self.names):
+                if name in present:
+                    r = module.r[name]
+                    lora_A[i, :r] = module.lora_A[name].weight
+                    lora_B[i, :, :r] = module.lora_B[name].weight * module.scaling[name]
+        return lora_A, lora_B
+
+    def _hook(self, bank, module, inputs, output):
+        lora_A, lora_B = bank
+        x = inputs[0]
+        if x.shape[0] != len(self.index):
+            raise RuntimeError(f"LoRA layer got a batch of {x.shape[0]} for {len(self.index)} per-sample adapters")
+        hidden = x.reshape(x.shape[0], -1, x.shape[-1]).to(lora_A.dtype)
+        hidden = torch.bmm(hidden, lora_A[self.index].transpose(1, 2))
+        hidden = torch.bmm(hidden, lora_B[self.index].transpose(1, 2))
+        hidden = hidden * self.scales.to(hidden.dtype)[:, None, None]
+        return output + hidden.reshape(output.shape).to(output.dtype)
+
+    def remove(self):
+        for handle in self.handles:
+            handle.remove()
+        self.handles = []
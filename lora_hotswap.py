@@ -0,0 +1,26 @@
+import torch
+
+HOTSWAP_ADAPTER = "hotswap"
+
+def prepare_hotswap_slot(pipeline, rank, adapter_name=HOTSWAP_ADAPTER):
+    # Preallocates one adapter at the maximum rank on every linear layer of the transformer, with all-zero weights.
+    # LoRAs hot-swapped into it only have their A/B matrices copied (and zero-padded) into these buffers, and the
+    # layers they do not target are zeroed, so module structure, parameter shapes and the (tensor) scalings never
+    # change again and a compiled transformer stays valid across styles.
+    # Must run before the first LoRA is loaded and before the transformer is compiled.
+    transformer = pipeline.transformer
+    state_dict = {}
+    for module_name, module in transformer.named_modules():
+        if isinstance(module, torch.nn.Linear):
+            state_dict[f"transformer.{module_name}.lora_A.weight"] = torch.zeros(rank, module.in_features, dtype=transformer.dtype)
+            state_dict[f"transformer.{module_name}.lora_B.weight"] = torch.zeros(module.out_features, rank, dtype=transformer.dtype)
+    pipeline.enable_lora_hotswap(target_rank=rank)
+    pipeline.load_lora_weights(state_dict, adapter_name=adapter_name)
+    return sum(tensor.numel() * tensor.element_size() for tensor in state_dict.values())
+
+def hotswap_lora(pipeline, pretrained_model_name_or_path_or_dict, adapter_name=HOTSWAP_ADAPTER, **kwargs):
+    # raises if the LoRA targets layers outside the slot or has a rank above it; a failed swap can leave the slot
+    # half written, so it must not be used until the next successful swap
+    pipeline.load_lora_weights(pretrained_model_name_or_path_or_dict, adapter_name=adapter_name, hotswap=True, **kwargs)
+    # set_adapter (unlike set_adapters) keeps the swapped-in scaling instead of recomputing it from the slot config
+    pipeline.transformer.set_adapter(adapter_name)
@@ -0,0 +1,338 @@
+import os
+import re
+import time
+import hashlib
+import threading
+import contextlib
+from collections import OrderedDict
+
+import torch
+from diffusers.utils.peft_utils import set_adapter_layers
+from peft.tuners.tuners_utils import BaseTunerLayer
+from safetensors import safe_open
+
+from lora_batching import GatheredLora
+from lora_hotswap import HOTSWAP_ADAPTER, hotswap_lora, prepare_hotswap_slot
+
+def lora_adapter_name(lora):
+    # peft adapter names end up as ModuleDict keys, so they must not contain dots
+    key = f"{lora['repo']}/{lora.get('weights') or ''}"
+    slug = re.sub(r"[^0-9a-zA-Z]+", "_", lora["repo"]).strip("_")[:48]
+    return f"{slug}_{hashlib.sha1(key.encode()).hexdigest()[:8]}"
+
+class LoraCache:
+    # fetch(lora) returns the local path of a catalog entry's weights file
+    def __init__(self, pipeline, fetch, max_adapters=20, budget_mb=8192, fuse_mode="off", fuse_min_uses=3, fuse_snapshot_mb=4096, hotswap_rank=None, mixed_bank_mb=2048):
+        self.pipeline = pipeline
+        self.fetch = fetch
+        self.max_adapters = max_adapters
+        self.budget_bytes = int(budget_mb * 1024 * 1024)
+        self.resident = OrderedDict()  # adapter name -> bytes, least recently used first
+        self.active = None
+        self.active_weights = ()  # (adapter name, weight) pairs passed to set_adapters
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.lock = threading.RLock()
+        # fused fast path
+        self.fuse_mode = fuse_mode
+        self.fuse_min_uses = fuse_min_uses
+        self.snapshot_budget_bytes = int(fuse_snapshot_mb * 1024 * 1024)
+        self.unfusable = set()  # adapters whose base weight snapshot is over the budget
+        self.fused = None  # (adapter name, scale) currently merged into the transformer
+        self.pristine = []  # (base layer, original weight, original bias) kept on cpu for an exact unfuse
+        self.uses = {}
+        self.streak = 0
+        self.streak_ema = {}  # adapter name -> average number of consecutive requests
+        self.fuse_cost = {"fuse": None, "unfuse": None}
+        self.step_time = {}  # (fused, pixels) -> average seconds per denoising step
+        self.fuse_decisions = []
+        # zero-padded A/B banks of mixed batches, kept while all their adapters stay resident
+        self.mixed_banks = OrderedDict()  # sorted adapter names -> (banks, bytes), least recently used first
+        self.mixed_bank_budget_bytes = int(mixed_bank_mb * 1024 * 1024)
+        # hot-swap slot
+        self.hotswap_rank = hotswap_rank
+        self.hotswapped = None  # adapter name whose weights are currently in the slot
+        self.unswappable = set()
+        self.transformer_only_cache = {}  # adapter name -> whether the weights are a plain LoRA for the transformer alone
+        if hotswap_rank is not None:
+            start = time.perf_counter()
+            nbytes = prepare_hotswap_slot(pipeline, hotswap_rank)
+            print(f"LoRA hot-swap slot: rank {hotswap_rank}, {nbytes / 2**20:.1f} MB, preallocated in {time.perf_counter() - start:.1f}s")
+
+    def resident_bytes(self):
+        return sum(self.resident.values())
+
+    def activate(self, lora, scale=1.0, steps=28, width=1024, height=1024):
+        name = lora_adapter_name(lora)
+        with self.lock:
+            if self._activate_hotswap(name, lora):
+                return name
+            if self.fused is not None and self.fused != (name, scale):
+                self._unfuse()
+            if name in self.resident:
+                self.resident.move_to_end(name)
+                self.hits += 1
+            else:
+                self.misses += 1
+                self._load(name, lora)
+            if self.active != name:
+                if self.active is not None:
+                    previous = self.streak_ema.get(self.active, self.streak)
+                    self.streak_ema[self.active] = 0.7 * previous + 0.3 * self.streak
+                self.pipeline.set_adapters([name], adapter_weights=[1.0])
+                self._enable_text_encoder_lora(True)
+                self.active = name
+                self.active_weights = ((name, 1.0),)
+                self.streak = 0
+                print(f"Active LoRA adapters: {self.active_adapters()}")
+            self.streak += 1
+            self.uses[name] = self.uses.get(name, 0) + 1
+            if self.fused is None and self._should_fuse(name, steps, width * height):
+                self._fuse(name, scale)
+            print(f"LoRA cache: {len(self.resident)} resident, {self.resident_bytes() / 2**20:.1f} MB, "
+                  f"hits={self.hits} misses={self.misses} evictions={self.evictions} fused={self.fused}")
+        return name
+
+    def activate_stack(self, weighted_loras):
+        # several adapters composed with their own weights; stacks always run unfused
+        names = [lora_adapter_name(lora) for lora, _ in weighted_loras]
+        weights = [weight for _, weight in weighted_loras]
+        stack_name = "+".join(names)
+        with self.lock:
+            if self.fused is not None:
+                self._unfuse()
+            for name, (lora, _) in zip(names, weighted_loras):
+                if name in self.resident:
+                    self.resident.move_to_end(name)
+                    self.hits += 1
+                else:
+                    self.misses += 1
+                    self._load(name, lora, protected=set(names))
+            self.pipeline.set_adapters(names, adapter_weights=weights)
+            self._enable_text_encoder_lora(True)
+            self.active_weights = tuple(zip(names, weights))
+            if self.active != stack_name:
+                self.active = stack_name
+                self.streak = 0
+                print(f"Active LoRA adapters: {self.active_adapters()}")
+            self.streak += 1
+            print(f"LoRA cache: stacked {list(zip(names, weights))}, {len(self.resident)} resident, "
+                  f"hits={self.hits} misses={self.misses} evictions={self.evictions}")
+        return names
+
+    @contextlib.contextmanager
+    def gathered(self, weighted_loras):
+        # one (lora, scale) per batch sample; the adapters stay loaded but disabled in peft and GatheredLora hooks
+        # apply each sample's own adapter, so no global adapter state is set while the batch runs
+        loras = {lora_adapter_name(lora): lora for lora, _ in weighted_loras}
+        names = sorted(loras)
+        with self.lock:
+            if self.fused is not None:
+                self._unfuse()
+            for name, lora in loras.items():
+                if name in self.resident:
+                    self.resident.move_to_end(name)
+                    self.hits += 1
+                else:
+                    self.misses += 1
+                    self._load(name, lora, protected=set(names))
+            # weight 1.0 leaves the peft scaling at alpha / r; the per-sample scales are applied by the hooks
+            self.pipeline.set_adapters(names, adapter_weights=[1.0] * len(names))
+            self.pipeline.transformer.disable_lora()
+            self.active = None
+            self.active_weights = ()
+            cached = self.mixed_banks.pop(tuple(names), None)
+            gathered = GatheredLora(
+                self.pipeline.transformer,
+                names,
+                [lora_adapter_name(lora) for lora, _ in weighted_loras],
+                [scale for _, scale in weighted_loras],
+                banks=cached[0] if cached is not None else None,
+            )
+            self._keep_mixed_banks(tuple(names), gathered)
+            print(f"LoRA cache: gathering {len(names)} adapters over {gathered.layers} layers "
+                  f"({gathered.bank_bytes / 2**20:.1f} MB bank, {'reused' if cached is not None else 'built'}), "
+                  f"{len(self.resident)} resident, hits={self.hits} misses={self.misses} evictions={self.evictions}")
+        try:
+            yield gathered
+        finally:
+            gathered.remove()
+            self.pipeline.transformer.enable_lora()
+
+    def _keep_mixed_banks(self, key, gathered):
+        if gathered.bank_bytes > self.mixed_bank_budget_bytes:
+            return
+        self.mixed_banks[key] = (gathered.banks, gathered.bank_bytes)
+        while sum(nbytes for _, nbytes in self.mixed_banks.values()) > self.mixed_bank_budget_bytes:
+            self.mixed_banks.popitem(last=False)
+
+    def _drop_mixed_banks(self, name):
+        for key in [key for key in self.mixed_banks if name in key]:
+            del self.mixed_banks[key]
+
+    def active_adapters(self):
+        return set(self.pipeline.get_active_adapters())
+
+    def transformer_only(self, lora):
+        # text encoder LoRAs change the shared prompt encoding and DoRA needs the peft forward, so neither can be
+        # applied per sample or hot-swapped into the transformer slot
+        name = lora_adapter_name(lora)
+        if name not in self.transformer_only_cache:
+            with safe_open(self.fetch(lora), framework="pt") as weights:
+                keys = list(weights.keys())
+            self.transformer_only_cache[name] = not any(key.startswith(("text_encoder", "lora_te")) or "dora" in key or "magnitude" in key for key in keys)
+        return self.transformer_only_cache[name]
+
+    def text_encoder_adapters(self):
+        # active adapters that change the CLIP text encoder output, with their weights
+        peft_config = getattr(self.pipeline.text_encoder, "peft_config", None) or {}
+        return tuple((name, weight) for name, weight in self.active_weights if name in peft_config)
+
+    def record_step_time(self, seconds_per_step, width, height):
+        key = (self.fused is not None, width * height)
+        previous = self.step_time.get(key)
+        self.step_time[key] = seconds_per_step if previous is None else 0.8 * previous + 0.2 * seconds_per_step
+
+    def _activate_hotswap(self, name, lora):
+        if self.hotswap_rank is None or name in self.unswappable or not self.transformer_only(lora):
+            return False
+        if self.fused is not None:
+            self._unfuse()
+        if self.hotswapped == name:
+            self.hits += 1
+        else:
+            self.misses += 1
+            local_path = self.fetch(lora)
+            start = time.perf_counter()
+            try:
+                hotswap_lora(self.pipeline, os.path.dirname(local_path), weight_name=os.path.basename(local_path))
+            except Exception as e:
+                # e.g. a rank above the slot or layers outside it; such LoRAs load as separate adapters
+                print(f"Cannot hot-swap {name}, loading it as a separate adapter: {e}")
+                self.unswappable.add(name)
+                self.hotswapped = None
+                return False
+            self.hotswapped = name
+            print(f"Hot-swapped LoRA {name} in {time.perf_counter() - start:.3f}s")
+        self.pipeline.transformer.set_adapter(HOTSWAP_ADAPTER)
+        self._enable_text_encoder_lora(False)
+        self.active = HOTSWAP_ADAPTER
+        self.active_weights = ((HOTSWAP_ADAPTER, 1.0),)
+        return True
+
+    def _enable_text_encoder_lora(self, enabled):
+        # the hot-swap slot only lives in the transformer, so text encoder adapters must be off while it is active
+        for component in ("text_encoder", "text_encoder_2"):
+            module = getattr(self.pipeline, component, None)
+            if module is not None and getattr(module, "peft_config", None):
+                set_adapter_layers(module, enabled=enabled)
+
+    def _should_fuse(self, name, steps, pixels):
+        if self.fuse_mode == "off" or name in self.unfusable:
+            return False
+        snapshot_bytes = sum(
+            sum(t.numel() * t.element_size() for t in (layer.weight, layer.bias) if t is not None)
+            for layer in self._fuse_targets(name)
+        )
+        if snapshot_bytes > self.snapshot_budget_bytes:
+            print(f"Not fusing {name}: its base weight snapshot would take {snapshot_bytes / 2**20:.0f} MB of host memory")
+            self.unfusable.add(name)
+            return False
+        if self.fuse_mode == "always":
+            return True
+        if self.fuse_mode != "auto" or self.uses[name] < self.fuse_min_uses:
+            return False
+        unfused = self.step_time.get((False, pixels))
+        fused = self.step_time.get((True, pixels))
+        if None in (unfused, fused, self.fuse_cost["fuse"], self.fuse_cost["unfuse"]):
+            # nothing measured yet at this resolution, fuse once so both sides of the trade-off get timed
+            decision = True
+            saving = cost = None
+        else:
+            expected_requests = max(self.streak_ema.get(name, 1.0), 1.0)
+            saving = (unfused - fused) * steps * expected_requests
+            cost = self.fuse_cost["fuse"] + self.fuse_cost["unfuse"]
+            decision = saving > cost
+        self.fuse_decisions.append({"adapter": name, "steps": steps, "pixels": pixels, "expected_saving": saving, "cost": cost, "fuse": decision})
+        del self.fuse_decisions[:-100]
+        print(f"Fuse decision for {name}: saving={saving} cost={cost} -> {'fuse' if decision else 'keep unfused'}")
+        return decision
+
+    def _fuse_targets(self, name):
+        return [
+            module.get_base_layer() for module in self.pipeline.transformer.modules()
+            if isinstance(module, BaseTunerLayer) and name in getattr(module, "lora_A", {})
+        ]
+
+    def _fuse(self, name, scale):
+        start = time.perf_counter()
+        for base_layer in self._fuse_targets(name):
+            bias = base_layer.bias.detach().to("cpu", copy=True) if base_layer.bias is not None else None
+            self.pristine.append((base_layer, base_layer.weight.detach().to("cpu", copy=True), bias))
+        self.pipeline.fuse_lora(components=["transformer"], lora_scale=scale, adapter_names=[name])
+        self.fused = (name, scale)
+        self._record_cost("fuse", time.perf_counter() - start)
+
+    def _unfuse(self):
+        start = time.perf_counter()
+        # unfuse_lora keeps the pipeline/peft bookkeeping consistent; subtracting the delta is not exact in bf16,
+        # so the original weights are copied back on top afterwards
+        self.pipeline.unfuse_lora(components=["transformer"])
+        with torch.no_grad():
+            for base_layer, weight, bias in self.pristine:
+                base_layer.weight.copy_(weight)
+                if bias is not None:
+                    base_layer.bias.copy_(bias)
+        self.pristine = []
+        self.fused = None
+        self._record_cost("unfuse", time.perf_counter() - start)
+
+    def _record_cost(self, kind, seconds):
+        previous = self.fuse_cost[kind]
+        self.fuse_cost[kind] = seconds if previous is None else 0.8 * previous + 0.2 * seconds
+        print(f"LoRA {kind} took {seconds:.3f}s")
+
+    def _load(self, name, lora, protected=()):
+        local_path = self.fetch(lora)
+        try:
+            self.pipeline.load_lora_weights(
+                os.path.dirname(local_path),
+                weight_name=os.path.basename(local_path),
+                adapter_name=name,
+                low_cpu_mem_usage=True
+            )
+        except Exception:
+            # a failed load can leave a half-registered adapter behind
+            if name in self.pipeline.get_list_adapters().get("transformer", []):
+                self.pipeline.delete_adapters(name)
+            raise
+        self.resident[name] = self._adapter_nbytes(name)
+        self._evict(protected={name, *protected})
+
+    def _evict(self, protected=()):
+        while len(self.resident) > 1 and (len(self.resident) > self.max_adapters or self.resident_bytes() > self.budget_bytes):
+            victim = next((name for name in self.resident if name not in protected), None)
+            if victim is None:
+                break
+            nbytes = self.resident.pop(victim)
+            if self.fused is not None and self.fused[0] == victim:
+                self._unfuse()
+            self.pipeline.delete_adapters(victim)
+            self._drop_mixed_banks(victim)
+            self.evictions += 1
+            if self.active == victim:
+                self.active = None
+                self.active_weights = ()
+            print(f"Evicted LoRA adapter {victim} ({nbytes / 2**20:.1f} MB)")
+
+    def _adapter_nbytes(self, name):
+        total = 0
+        for component in ("transformer", "text_encoder"):
+            module = getattr(self.pipeline, component, None)
+            if module is None:
+                continue
+            for param_name, param in module.named_parameters():
+                if f".{name}." in param_name:
+                    total += param.numel() * param.element_size()
+        return total
@@ -0,0 +1,214 @@
+import time
+import threading
+from contextlib import contextmanager
+
+from live_preview_helpers import resolve_preview
+
+class FrameStream:
+    # The denoising loop publishes into this slot from a scheduler thread and only ever overwrites the latest
+    # frame. A slow client never stalls the GPU loop and never receives a backlog of stale frames: it gets the
+    # newest frame plus the current step whenever it is ready for the next update.
+    def __init__(self, total_steps):
+        self.total_steps = total_steps
+        self.cond = threading.Condition()
+        self.step = 0
+        self.frame = None
+        self.index = None
+        self.version = 0
+        self.done = False
+        self.error = None
+        self.abandoned = False
+        self.cancelled = False
+
+    def publish(self, frame, index=None):
+        # frame is a batched frame when index is set; this request's image is frame[index]
+        with self.cond:
+            self.step += 1
+            if frame is not None:
+                self.frame, self.index = frame, index
+                self.version += 1
+            self.cond.notify_all()
+
+    def cancel(self):
+        # the consumer stops right away; the scheduler drops the job if it is still pending, or stops its batch
+        # at the next step once no job in it is left
+        with self.cond:
+            self.cancelled = True
+            self.abandoned = True
+            self.done = True
+            self.cond.notify_all()
+
+    def finish(self, error=None):
+        with self.cond:
+            if self.cancelled:
+                return
+            self.error = error
+            self.done = True
+            self.cond.notify_all()
+
+    def __iter__(self):
+        # yields (step, newest image or None if unchanged since the last yield, done)
+        seen_step = seen_version = 0
+        try:
+            while True:
+                with self.cond:
+                    self.cond.wait_for(lambda: self.done or self.step != seen_step or self.version != seen_version)
+                    step, version, frame, index, done = self.step, self.version, self.frame, self.index, self.done
+                if done and self.error is not None:
+                    raise self.error
+                image = None
+                if version != seen_version:
+                    image = resolve_preview(frame)
+                    if index is not None:
+                        image = image[index]
+                yield step, image, done
+                if done:
+                    return
+                seen_step, seen_version = step, version
+        finally:
+            with self.cond:
+                self.abandoned = True
+
+class GenerationScheduler:
+    # Leader/follower: every submitted job gets a driver thread that waits for the GPU. Whichever driver gets it
+    # picks the next head job, runs it together with every compatible pending job (same key) and publishes the
+    # batched frames to each job's stream.
+    #
+    # Head selection is LoRA-affine: while the oldest job has waited less than fairness_window seconds, a pending
+    # job that uses the adapters already active goes first, so bursts for different LoRAs do not thrash through
+    # adapter swaps. Once the oldest job reaches the window it runs next, so no job starves. fairness_window=0 is
+    # plain FIFO.
+    #
+    # Jobs need key, adapters, submitted_at, stream (a FrameStream) and started (a threading.Event);
+    # run_batch(batch) returns an iterable of batched frames.
+    def __init__(self, run_batch, max_batch_size=4, window=0.05, fairness_window=10.0, clock=time.monotonic):
+        self.run_batch = run_batch
+        self.max_batch_size = max(1, max_batch_size)
+        self.window = window
+        self.fairness_window = fairness_window
+        self.clock = clock
+        self.lock = threading.Lock()
+        self.gpu_lock = threading.Lock()
+        self.pending = []
+        self.active = None  # adapters of the last batch that ran
+        self.batches = 0
+        self.batched_jobs = 0
+        self.swaps = 0
+        self.swaps_avoided = 0
+        self.added_wait = 0.0  # seconds that jobs spent waiting because younger jobs were moved ahead of them
+
+    def submit(self, job):
+        with self.lock:
+            self.pending.append(job)
+        threading.Thread(target=self._drive, args=(job,), name="generation-driver", daemon=True).start()
+        return job.stream
+
+    @contextmanager
+    def exclusive(self, adapters):
+        # for work that never batches but still owns the GPU and changes the active adapters
+        with self.gpu_lock:
+            self._note_adapters(adapters)
+            yield
+
+    def submit_exclusive(self, adapters, run, stream):
+        # image-to-image never batches: run() yields this stream's own frames once its driver owns the GPU
+        def drive():
+            with self.exclusive(adapters):
+                if not stream.abandoned:
+                    self._stream(run, [(stream, None)])
+        threading.Thread(target=drive, name="exclusive-driver", daemon=True).start()
+        return stream
+
+    def metrics(self):
+        with self.lock:
+            return {
+                "batches": self.batches,
+                "batched_jobs": self.batched_jobs,
+                "swaps": self.swaps,
+                "swaps_avoided": self.swaps_avoided,
+                "added_wait": self.added_wait,
+                "pending": len(self.pending),
+            }
+
+    def _drive(self, job):
+        while not job.started.is_set():
+            with self.gpu_lock:
+                if job.started.is_set():
+                    return
+                if self.window > 0 and self._compatible_pending() < self.max_batch_size:
+                    time.sleep(self.window)
+                batch, bypassed = self._take_batch()
+                if batch:
+                    self._run(batch, bypassed)
+
+    def choose_head(self, pending, now):
+        oldest = pending[0]
+        if oldest.adapters == self.active or now - oldest.submitted_at >= self.fairness_window:
+            return oldest
+        return next((job for job in pending if job.adapters == self.active), oldest)
+
+    def _compatible_pending(self):
+        with self.lock:
+            if not self.pending:
+                return 0
+            key = self.choose_head(self.pending, self.clock()).key
+            return sum(job.key == key for job in self.pending)
+
+    def _take_batch(self):
+        with self.lock:
+            for job in [job for job in self.pending if job.stream.abandoned]:
+                self.pending.remove(job)
+                job.started.set()
+            if not self.pending:
+                return [], 0
+            head = self.choose_head(self.pending, self.clock())
+            # jobs older than the head that do not ride along in its batch wait for it
+            bypassed = self.pending[:self.pending.index(head)]
+            batch = [job for job in self.pending if job.key == head.key][:self.max_batch_size]
+            bypassed = sum(job not in batch for job in bypassed)
+            if bypassed:
+                self.swaps_avoided += 1
+            for job in batch:
+                self.pending.remove(job)
+                job.started.set()
+            return batch, bypassed
+
+    def _note_adapters(self, adapters):
+        with self.lock:
+            if self.active is not None and adapters != self.active:
+                self.swaps += 1
+            self.active = adapters
+
+    def _run(self, batch, bypassed=0):
+        self._note_adapters(batch[0].adapters)
+        with self.lock:
+            self.batches += 1
+            self.batched_jobs += len(batch)
+        if len(batch) > 1:
+            print(f"Batching {len(batch)} requests ({self.batched_jobs} requests in {self.batches} batches so far)")
+        start = self.clock()
+        try:
+            self._stream(lambda: self.run_batch(batch), [(job.stream, index) for index, job in enumerate(batch)])
+        finally:
+            with self.lock:
+                self.added_wait += bypassed * (self.clock() - start)
+
+    def _stream(self, run, targets):
+        # targets are (stream, index) pairs; index None means every frame is that stream's own image
+        try:
+            frames = run()
+            try:
+                for frame in frames:
+                    # stop the pipeline generator once every client went away
+                    if all(stream.abandoned for stream, _ in targets):
+                        break
+                    for stream, index in targets:
+                        stream.publish(frame, index)
+            finally:
+                getattr(frames, "close", lambda: None)()
+        except Exception as e:
+            for stream, _ in targets:
+                stream.finish(e)
+        else:
+            for stream, _ in targets:
+                stream.finish()